@@ -1,7 +1,10 @@
 import sys
 import sqlite3
-import hashlib
+from hashlib import sha256
+import threading
+from bisect import bisect_right
 from datetime import datetime, timedelta
+import numpy as np
 import pandas as pd
 from PyQt5.QtWidgets import *
 from PyQt5.QtCore import *
@@ -11,26 +14,121 @@ try:
 except ImportError:
     from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
+try:
+    import xlsxwriter
+    EXCEL_ENGINE = "xlsxwriter"
+except ImportError:
+    EXCEL_ENGINE = None  # fall back to pandas' default writer
 import matplotlib.pyplot as plt
 from reportlab.lib.pagesizes import letter, A4
 from reportlab.pdfgen import canvas
 from reportlab.lib import colors
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
+from reportlab.platypus import SimpleDocTemplate, Table, LongTable, TableStyle, Paragraph, Spacer
 from reportlab.lib.units import inch, mm
 import json
 import os
 
+# Item row shape shared by the items tables and reports. Columns after date_added are
+# not displayed: stock value, status (0 depleted, 1 low, 2 normal) and category_id.
+ITEM_ROW_QUERY = """
+    SELECT i.id, i.name, c.name AS category, i.quantity, i.price, i.min_stock,
+           i.supplier, i.barcode, i.date_added,
+           COALESCE(i.quantity, 0) * COALESCE(i.price, 0) AS value,
+           CASE WHEN i.quantity = 0 THEN 0
+                WHEN i.quantity > 0 AND i.quantity <= COALESCE(i.min_stock, 0) THEN 1
+                ELSE 2 END AS status,
+           i.category_id
+    FROM items i
+    LEFT JOIN categories c ON i.category_id = c.id
+"""
+# Same row shape returned directly by INSERT/UPDATE on items
+ITEM_ROW_RETURNING = """
+    RETURNING id, name, (SELECT c.name FROM categories c WHERE c.id = items.category_id) AS category,
+              quantity, CAST(price AS REAL) AS price, min_stock, supplier, barcode, date_added,
+              COALESCE(quantity, 0) * COALESCE(price, 0) AS value,
+              CASE WHEN quantity = 0 THEN 0
+                   WHEN quantity > 0 AND quantity <= COALESCE(min_stock, 0) THEN 1
+                   ELSE 2 END AS status,
+              category_id
+"""
+SQLITE_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+# Category statements; kept as constants so sqlite3's statement cache reuses them
+CATEGORY_ROW_QUERY = "SELECT id, name, description FROM categories"
+CATEGORY_INSERT = "INSERT INTO categories (name, description) VALUES (?, ?)"
+CATEGORY_INSERT_RETURNING = CATEGORY_INSERT + " RETURNING id, name, description"
+CATEGORY_UPDATE = "UPDATE categories SET name=?, description=? WHERE id=?"
+CATEGORY_DELETE = "DELETE FROM categories WHERE id=?"
+
+# Report labels indexed by the status column of ITEM_ROW_QUERY
+STOCK_STATUS_ICONS = ("🔴", "🟡", "🟢")
+STOCK_STATUS_LABELS = ("DEPLETED", "LOW", "NORMAL")
+
+# Low stock highlight colours
+LOW_STOCK_BG = QColor("#ffebee")
+LOW_STOCK_FG = QColor("#c62828")
+
+# Fixed report text, built once at import
+_SEP_THICK = "━" * 91
+_SEP_WIDE = "━" * 122
+_BOX_TOP = "╔" + "═" * 86 + "╗"
+_BOX_BOT = "╚" + "═" * 86 + "╝"
+_ACTION_BLOCK = (
+    "EXECUTIVE ACTION REQUIREMENTS\n"
+    f"{_SEP_THICK}\n"
+    "PRIORITY 1 (IMMEDIATE - NEXT 24 HOURS):\n"
+    "• Initiate emergency supplier communication protocols\n"
+    "• Activate expedited procurement procedures\n"
+    "• Issue stock depletion notifications to sales operations\n\n"
+    "PRIORITY 2 (SHORT-TERM - NEXT 72 HOURS):\n"
+    "• Evaluate alternative supplier arrangements\n"
+    "• Assess customer impact and communication strategy\n"
+    "• Review procurement forecasting models\n\n"
+    "PRIORITY 3 (STRATEGIC - NEXT 7 DAYS):\n"
+    "• Conduct supply chain resilience assessment\n"
+    "• Implement enhanced inventory monitoring protocols\n"
+    "• Update minimum stock level parameters\n\n"
+)
+_OK_BLOCK = (
+    "OPERATIONAL STATUS: OPTIMAL\n"
+    f"{_SEP_THICK}\n"
+    "✅ EXCELLENT: All inventory items maintain positive stock levels\n"
+    "✅ Supply chain operations performing within acceptable parameters\n"
+    "✅ No immediate procurement actions required\n\n"
+    "RECOMMENDATION: Continue standard inventory monitoring protocols\n\n"
+)
+
+def _fit(value, width, default):
+    """Truncate to width - 1 characters and pad to width, keeping one space of gutter"""
+    return (value or default)[:width - 1].ljust(width)
+
 # Database Manager
 class DatabaseManager:
+    WRITE_STATEMENTS = {'INSERT', 'UPDATE', 'DELETE'}
+    TABLES = {'users', 'audit_log', 'categories', 'warehouses', 'suppliers', 'items', 'purchase_orders'}
+
     def __init__(self, db_name="inventory.db"):
         self.db_name = db_name
+        self._lock = threading.Lock()
+        # Single long-lived connection; transactions are managed explicitly and
+        # prepared statements are reused from sqlite3's per-connection cache
+        self.conn = sqlite3.connect(db_name, check_same_thread=False, isolation_level=None,
+                                    cached_statements=256)
+        # Rows support both positional and column-name access
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA temp_store=MEMORY")
+        self.conn.execute("PRAGMA cache_size=-65536")
+        self.conn.execute("PRAGMA mmap_size=268435456")
         self.init_database()
 
     def init_database(self):
         """Initialize database with required tables and migrate if needed"""
-        conn = sqlite3.connect(self.db_name)
-        cursor = conn.cursor()
+        cursor = self.conn.cursor()
+        # Run the whole bootstrap as one transaction (a single commit)
+        cursor.execute("BEGIN")
 
         # Users table (roles: admin, manager, staff)
         cursor.execute('''CREATE TABLE IF NOT EXISTS users (
@@ -68,129 +166,191 @@ class DatabaseManager:
             FOREIGN KEY (category_id) REFERENCES categories (id),
             FOREIGN KEY (warehouse_id) REFERENCES warehouses (id))''')
 
+        # Items indexes for stock filters, category joins and name ordering
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_items_quantity ON items(quantity)")
+        # (category_id, quantity) also serves plain category_id lookups
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_items_category_quantity ON items(category_id, quantity)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_items_name ON items(name)")
+        # Partial index covering the out-of-stock listing
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_items_zero ON items(name) WHERE quantity = 0")
+
         # Purchase orders table
         cursor.execute('''CREATE TABLE IF NOT EXISTS purchase_orders (
             id INTEGER PRIMARY KEY, supplier_id INTEGER, item_id INTEGER, quantity INTEGER, order_date TEXT, status TEXT,
             FOREIGN KEY (supplier_id) REFERENCES suppliers(id),
             FOREIGN KEY (item_id) REFERENCES items(id))''')
 
-        # Add default admin user
-        cursor.execute("INSERT OR IGNORE INTO users (id, username, password, role, email, last_login) VALUES (?, ?, ?, ?, ?, ?)", (1, 'admin', hashlib.sha256('admin'.encode()).hexdigest(), 'admin', 'admin@inventorypro.com', None))
+        # Add default admin user (only hashed when the account is missing)
+        if not cursor.execute("SELECT 1 FROM users WHERE id=1").fetchone():
+            cursor.execute("INSERT OR IGNORE INTO users (id, username, password, role, email, last_login) VALUES (?, ?, ?, ?, ?, ?)", (1, 'admin', sha256('admin'.encode()).hexdigest(), 'admin', 'admin@inventorypro.com', None))
 
         # Add default warehouse
         cursor.execute("INSERT OR IGNORE INTO warehouses VALUES (1, 'Main Warehouse', 'HQ')")
 
-        conn.commit()
-        conn.close()
+        self.conn.commit()
 
     def execute_query(self, query, params=(), fetch=False, audit_user=None, audit_action=None, audit_details=None):
-        conn = None
-        try:
-            conn = sqlite3.connect(self.db_name)
-            cursor = conn.cursor()
-            cursor.execute(query, params)
-            result = cursor.fetchall() if fetch else None
-            conn.commit()
-            # Audit log
-            if audit_user and audit_action:
-                cursor.execute("INSERT INTO audit_log (user_id, action, details, timestamp) VALUES (?, ?, ?, ?)", (audit_user, audit_action, audit_details or str(params), datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
-                conn.commit()
-            return result
-        except Exception as e:
-            print(f"Database error: {e}")
-            return None
-        finally:
-            if conn:
-                conn.close()  # Always close connection
+        is_write = query.lstrip()[:6].upper() in self.WRITE_STATEMENTS
+        with self._lock:
+            try:
+                if is_write:
+                    self.conn.execute("BEGIN")
+                cursor = self.conn.execute(query, params)
+                result = cursor.fetchall() if fetch else None
+                # Audit log shares the transaction of the write it describes
+                if audit_user and audit_action:
+                    self.conn.execute("INSERT INTO audit_log (user_id, action, details, timestamp) VALUES (?, ?, ?, ?)", (audit_user, audit_action, audit_details or str(params), datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
+                if is_write:
+                    self.conn.commit()
+                return result
+            except Exception as e:
+                if self.conn.in_transaction:
+                    self.conn.rollback()
+                print(f"Database error: {e}")
+                return None
+
+    def executemany(self, query, seq_of_params):
+        """Run a statement for every parameter set inside a single transaction"""
+        with self._lock:
+            try:
+                self.conn.execute("BEGIN")
+                cursor = self.conn.executemany(query, seq_of_params)
+                self.conn.commit()
+                return cursor.rowcount
+            except Exception as e:
+                if self.conn.in_transaction:
+                    self.conn.rollback()
+                print(f"Database error: {e}")
+                return None
+
+    def count(self, table, where=None, params=()):
+        """Return COUNT(*) for a known table, optionally filtered by a WHERE clause"""
+        if table not in self.TABLES:
+            raise ValueError(f"Unknown table: {table}")
+        query = f"SELECT COUNT(*) FROM {table}" + (f" WHERE {where}" if where else "")
+        result = self.execute_query(query, params, fetch=True)
+        return result[0][0] if result else 0
+
+    def fetch_rows(self, query, params=()):
+        """Return every row of a read query; unlike execute_query, errors propagate"""
+        # Rows are fetched in full under the lock so callers can format them,
+        # and make other DB calls, without holding the connection
+        with self._lock:
+            return self.conn.execute(query, params).fetchall()
+
+    def read_dataframe(self, query, params=()):
+        """Read a query result straight into a pandas DataFrame"""
+        with self._lock:
+            # Plain tuples let pandas build its columns without converting each Row
+            self.conn.row_factory = None
+            try:
+                return pd.read_sql_query(query, self.conn, params=params)
+            finally:
+                self.conn.row_factory = sqlite3.Row
+
+    def get_dashboard_stats(self):
+        """Return (total items, out of stock items, categories) in one round trip"""
+        result = self.execute_query("""
+            SELECT (SELECT COUNT(*) FROM items),
+                   (SELECT COUNT(*) FROM items WHERE quantity = 0),
+                   (SELECT COUNT(*) FROM categories)
+        """, fetch=True)
+        return tuple(result[0]) if result else (0, 0, 0)
+
+    def close(self):
+        """Close the persistent database connection"""
+        with self._lock:
+            if self.conn:
+                # Refresh planner statistics for tables whose size has changed
+                self.conn.execute("PRAGMA optimize")
+                self.conn.close()
+                self.conn = None
+
+# Application-wide stylesheet, parsed once by QApplication
+APP_QSS = """
+    QWidget 
+    { 
+        background-color: #f5f5f5; 
+        font-family: 'Segoe UI'; 
+    }
+    QLineEdit, QComboBox, QSpinBox, QDoubleSpinBox 
+    { 
+        padding: 8px; 
+        border: 2px solid #ddd; 
+        border-radius: 5px; 
+        background-color: white; font-size: 14px; 
+    }
+    QLineEdit:focus, QComboBox:focus 
+    { 
+        border-color: #4CAF50; 
+    }
+    QPushButton 
+    { 
+        padding: 10px 20px; 
+        background-color: #4CAF50; 
+        color: white; 
+        border: none; 
+        border-radius: 5px; 
+        font-size: 14px; 
+        font-weight: bold; 
+    }
+    QPushButton:hover 
+    { 
+        background-color: #45a049; 
+    }
+    QPushButton:pressed 
+    { 
+        background-color: #3d8b40; 
+    }
+    QTableView 
+    { 
+        gridline-color: #ddd; 
+        background-color: white; 
+        alternate-background-color: #f9f9f9; 
+    }
+    QTableView::item 
+    { 
+        padding: 8px; 
+    }
+    QTableView::item:selected 
+    { 
+        background-color: #4CAF50; color: white; 
+    }
+    QHeaderView::section 
+    { 
+        background-color: #2196F3; 
+        color: white; 
+        padding: 10px; 
+        font-weight: bold; 
+        border: none; 
+    }
+    QTabWidget::pane 
+    { 
+        border: 1px solid #ddd; 
+        background-color: white; 
+    }
+    QTabBar::tab 
+    { 
+        background-color: #e0e0e0; 
+        padding: 10px 20px; 
+        margin-right: 2px; 
+    }
+    QTabBar::tab:selected 
+    { 
+        background-color: #4CAF50; 
+        color: white; 
+    }
+    QGroupBox 
+    { 
+        font-weight: bold; 
+        border: 2px solid #ddd; 
+        border-radius: 5px; 
+        margin: 10px; padding-top: 10px; 
+    }
+"""
 
-# Modern Styled Widget Base
-class StyledWidget(QWidget):
-    def __init__(self):
-        super().__init__()
-        self.setStyleSheet("""
-            QWidget 
-            { 
-                background-color: #f5f5f5; 
-                font-family: 'Segoe UI'; 
-            }
-            QLineEdit, QComboBox, QSpinBox, QDoubleSpinBox 
-            { 
-                padding: 8px; 
-                border: 2px solid #ddd; 
-                border-radius: 5px; 
-                background-color: white; font-size: 14px; 
-            }
-            QLineEdit:focus, QComboBox:focus 
-            { 
-                border-color: #4CAF50; 
-            }
-            QPushButton 
-            { 
-                padding: 10px 20px; 
-                background-color: #4CAF50; 
-                color: white; 
-                border: none; 
-                border-radius: 5px; 
-                font-size: 14px; 
-                font-weight: bold; 
-            }
-            QPushButton:hover 
-            { 
-                background-color: #45a049; 
-            }
-            QPushButton:pressed 
-            { 
-                background-color: #3d8b40; 
-            }
-            QTableWidget 
-            { 
-                gridline-color: #ddd; 
-                background-color: white; 
-                alternate-background-color: #f9f9f9; 
-            }
-            QTableWidget::item 
-            { 
-                padding: 8px; 
-            }
-            QTableWidget::item:selected 
-            { 
-                background-color: #4CAF50; color: white; 
-            }
-            QHeaderView::section 
-            { 
-                background-color: #2196F3; 
-                color: white; 
-                padding: 10px; 
-                font-weight: bold; 
-                border: none; 
-            }
-            QTabWidget::pane 
-            { 
-                border: 1px solid #ddd; 
-                background-color: white; 
-            }
-            QTabBar::tab 
-            { 
-                background-color: #e0e0e0; 
-                padding: 10px 20px; 
-                margin-right: 2px; 
-            }
-            QTabBar::tab:selected 
-            { 
-                background-color: #4CAF50; 
-                color: white; 
-            }
-            QGroupBox 
-            { 
-                font-weight: bold; 
-                border: 2px solid #ddd; 
-                border-radius: 5px; 
-                margin: 10px; padding-top: 10px; 
-            }
-        """)
- 
 # Login Dialog
-class LoginDialog(QDialog, StyledWidget):
+class LoginDialog(QDialog):
     def __init__(self, db_manager):
         super().__init__()
         self.db_manager = db_manager
@@ -230,7 +390,7 @@ class LoginDialog(QDialog, StyledWidget):
      
     def login(self):
         username = self.username.text()
-        password = hashlib.sha256(self.password.text().encode()).hexdigest()
+        password = sha256(self.password.text().encode()).hexdigest()
          
         result = self.db_manager.execute_query(
             "SELECT id, role FROM users WHERE username=? AND password=?", 
@@ -249,31 +409,144 @@ class ChartWidget(FigureCanvas):
         self.figure = Figure(figsize=(8, 6), facecolor='white')
         super().__init__(self.figure)
         self.setParent(parent)
+        self._ax = self.figure.add_subplot(111)
+        self._bars = None
          
     def plot_stock_levels(self, data):
-        self.figure.clear()
-        ax = self.figure.add_subplot(111)
+        ax = self._ax
          
         if data:
             items, quantities = zip(*data)
-            colors = ['red' if q == 0 else 'orange' if q <= 5 else 'green' for q in quantities]
-            ax.bar(range(len(items)), quantities, color=colors)
-            ax.set_xticks(range(len(items)))
-            ax.set_xticklabels(items, rotation=45, ha='right')
-            ax.set_ylabel('Quantity')
-            ax.set_title('Stock Levels')
+            q = np.asarray(quantities)
+            colors = np.where(q == 0, 'red', np.where(q <= 5, 'orange', 'green'))
+            if self._bars is not None and len(self._bars) == len(q):
+                # Same bar count: update the existing artists in place
+                for bar, height, color in zip(self._bars, q, colors):
+                    bar.set_height(height)
+                    bar.set_color(color)
+                ax.set_xticklabels(items, rotation=45, ha='right')
+                ax.relim()
+                ax.autoscale_view()
+            else:
+                ax.clear()
+                positions = np.arange(len(items))
+                self._bars = ax.bar(positions, q, color=colors)
+                ax.set_xticks(positions)
+                ax.set_xticklabels(items, rotation=45, ha='right')
+                ax.set_ylabel('Quantity')
+                ax.set_title('Stock Levels')
+                self.figure.tight_layout()
+        else:
+            ax.clear()
+            self._bars = None
          
-        self.figure.tight_layout()
-        self.draw()
+        self.draw_idle()
  
+# Background Database Tasks
+class TaskSignals(QObject):
+    """Carries a background task's result or error back to the GUI thread"""
+    finished = pyqtSignal(object)
+    error = pyqtSignal(str)
+
+class DBTask(QRunnable):
+    """Run a database call on the global thread pool"""
+    def __init__(self, fn, *args, **kwargs):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = TaskSignals()
+
+    def run(self):
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except Exception as e:
+            self.signals.error.emit(str(e))
+        else:
+            self.signals.finished.emit(result)
+
+# Table Models
+class RowTableModel(QAbstractTableModel):
+    """Table model serving rows straight from query results"""
+    def __init__(self, headers, parent=None):
+        super().__init__(parent)
+        self._headers = headers
+        self._rows = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._headers)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            value = self._rows[index.row()][index.column()]
+            return str(value) if value is not None else ""
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self._headers[section]
+        # Row numbers on the vertical header, as QTableWidget showed them
+        return super().headerData(section, orientation, role)
+
+    def set_rows(self, rows):
+        """Replace all rows; cells are only stringified when painted"""
+        self.beginResetModel()
+        self._rows = list(rows)
+        self.endResetModel()
+
+    def row_data(self, row):
+        return self._rows[row]
+
+    def append_row(self, row):
+        position = len(self._rows)
+        self.beginInsertRows(QModelIndex(), position, position)
+        self._rows.append(row)
+        self.endInsertRows()
+
+    def remove_row(self, position):
+        self.beginRemoveRows(QModelIndex(), position, position)
+        del self._rows[position]
+        self.endRemoveRows()
+
+class ItemsModel(RowTableModel):
+    """Items table model with optional low stock highlighting"""
+    def __init__(self, headers, highlight=False, parent=None):
+        super().__init__(headers, parent)
+        self._highlight = highlight
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        # Highlight all cells in red for low stock items
+        if self._highlight and role == Qt.BackgroundRole:
+            return LOW_STOCK_BG
+        if self._highlight and role == Qt.ForegroundRole:
+            return LOW_STOCK_FG
+        return super().data(index, role)
+
+    def insert_row(self, row):
+        """Insert a single row, keeping the ORDER BY name of the loading queries"""
+        position = bisect_right(self._rows, row[1] or "", key=lambda r: r[1] or "")
+        self.beginInsertRows(QModelIndex(), position, position)
+        self._rows.insert(position, row)
+        self.endInsertRows()
+
 # Main Application
-class InventoryApp(QMainWindow, StyledWidget):
+class InventoryApp(QMainWindow):
     def __init__(self):
         super().__init__()
         self.db_manager = DatabaseManager()
         self.current_user_role = None
         self.current_user_id = None
-        self.categories = []
+        # Cached result sets, reset to None whenever the underlying rows change
+        self._categories_cache = None
+        self._category_name_map = None
+        self._all_items_cache = None
         self.setup_ui()
          
     def setup_ui(self):
@@ -315,7 +588,7 @@ class InventoryApp(QMainWindow, StyledWidget):
         self.statusBar().showMessage("Ready")
          
         # Load initial data
-        self.load_categories()
+        self._refresh_categories()
         self.clean_invalid_records()
      
     def create_toolbar(self):
@@ -324,7 +597,7 @@ class InventoryApp(QMainWindow, StyledWidget):
          
         # Refresh action
         refresh_action = QAction("Refresh", self)
-        refresh_action.triggered.connect(self.refresh_all_data)
+        refresh_action.triggered.connect(self.reload_all_data)
         toolbar.addAction(refresh_action)
          
         toolbar.addSeparator()
@@ -350,33 +623,30 @@ class InventoryApp(QMainWindow, StyledWidget):
         widget = QWidget()
         layout = QVBoxLayout()
          
-        # Stats cards
+        # Stats cards (counts are filled in by a background query)
         stats_layout = QHBoxLayout()
          
         # Total items card
-        total_items = len(self.db_manager.execute_query("SELECT * FROM items", fetch=True) or [])
-        total_card = self.create_stat_card("Total Items", str(total_items), "#2196F3")
-        stats_layout.addWidget(total_card)
+        self.total_card = self.create_stat_card("Total Items", "...", "#2196F3")
+        stats_layout.addWidget(self.total_card)
          
         # Low stock items (quantity = 0)
-        low_stock = len(self.db_manager.execute_query(
-            "SELECT * FROM items WHERE quantity = 0", fetch=True) or [])
-        low_stock_card = self.create_stat_card("Out of Stock", str(low_stock), "#f44336")
-        stats_layout.addWidget(low_stock_card)
+        self.low_stock_card = self.create_stat_card("Out of Stock", "...", "#f44336")
+        stats_layout.addWidget(self.low_stock_card)
          
         # Total categories
-        total_categories = len(self.db_manager.execute_query("SELECT * FROM categories", fetch=True) or [])
-        categories_card = self.create_stat_card("Categories", str(total_categories), "#4CAF50")
-        stats_layout.addWidget(categories_card)
+        self.categories_card = self.create_stat_card("Categories", "...", "#4CAF50")
+        stats_layout.addWidget(self.categories_card)
          
         layout.addLayout(stats_layout)
+        self.load_dashboard_stats()
          
         # Chart
         self.chart_widget = ChartWidget()
         layout.addWidget(self.chart_widget)
          
-        # Load chart data
-        self.load_chart_data()
+        # Load chart data once the window has painted
+        QTimer.singleShot(0, self.load_chart_data)
          
         widget.setLayout(layout)
         return widget
@@ -407,13 +677,35 @@ class InventoryApp(QMainWindow, StyledWidget):
         layout.addWidget(title_label)
         layout.addWidget(value_label)
         card.setLayout(layout)
+        card.value_label = value_label
         
         return card
      
+    def run_in_background(self, callback, fn, *args, error_callback=None, **kwargs):
+        """Run fn on the thread pool and deliver its result to callback on the GUI thread"""
+        task = DBTask(fn, *args, **kwargs)
+        if callback:
+            task.signals.finished.connect(callback)
+        if error_callback:
+            task.signals.error.connect(error_callback)
+        QThreadPool.globalInstance().start(task)
+     
+    def load_dashboard_stats(self):
+        """Load dashboard counts without blocking the GUI thread"""
+        self.run_in_background(self.update_dashboard_stats, self.db_manager.get_dashboard_stats)
+     
+    def update_dashboard_stats(self, stats):
+        """Show the counts returned by get_dashboard_stats"""
+        for card, value in zip((self.total_card, self.low_stock_card, self.categories_card), stats):
+            card.value_label.setText(str(value))
+     
     def load_chart_data(self):
-        """Load data for dashboard chart"""
-        items_data = self.db_manager.execute_query(
+        """Load data for dashboard chart without blocking the GUI thread"""
+        self.run_in_background(self.plot_chart_data, self.db_manager.execute_query,
             "SELECT name, quantity FROM items ORDER BY quantity ASC LIMIT 10", fetch=True)
+     
+    def plot_chart_data(self, items_data):
+        """Draw the chart once its data has arrived"""
         if items_data:
             self.chart_widget.plot_stock_levels(items_data)
      
@@ -486,9 +778,15 @@ class InventoryApp(QMainWindow, StyledWidget):
         form_group.setLayout(form_layout)
         
         # Items table
-        self.all_items_table = QTableWidget()
+        self.items_model = ItemsModel([
+            "ID", "Name", "Category", "Quantity", "Price", "Min Stock", 
+            "Supplier", "Barcode", "Date Added"
+        ])
+        self.all_items_table = QTableView()
+        self.all_items_table.setModel(self.items_model)
         self.all_items_table.setSelectionBehavior(QAbstractItemView.SelectRows)
-        self.all_items_table.cellClicked.connect(self.load_item_for_edit)
+        self.all_items_table.clicked.connect(self.load_item_for_edit)
+        self.set_column_widths(self.all_items_table, [50, 180, 120, 80, 80, 80, 150, 120, 100])
         
         layout.addWidget(form_group)
         layout.addWidget(self.all_items_table)
@@ -520,12 +818,17 @@ class InventoryApp(QMainWindow, StyledWidget):
         alert_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
         # Low stock items table
-        self.low_stock_table = QTableWidget()
+        self.low_stock_model = ItemsModel([
+            "ID", "Name", "Category", "Quantity", "Price", "Min Stock", "Supplier"
+        ], highlight=True)
+        self.low_stock_table = QTableView()
+        self.low_stock_table.setModel(self.low_stock_model)
         self.low_stock_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.set_column_widths(self.low_stock_table, [50, 180, 120, 80, 80, 80, 150])
         
         # Refresh button
         refresh_btn = QPushButton("Refresh Low Stock Items")
-        refresh_btn.clicked.connect(self.load_low_stock_items)
+        refresh_btn.clicked.connect(self.reload_items)
         
         layout.addWidget(alert_label)
         layout.addWidget(self.low_stock_table)
@@ -537,76 +840,35 @@ class InventoryApp(QMainWindow, StyledWidget):
         widget.setLayout(layout)
         return widget
     
+    def set_column_widths(self, table, widths):
+        """Apply initial column widths once; columns stay user-resizable"""
+        table.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
+        for column, width in enumerate(widths):
+            table.setColumnWidth(column, width)
+    
+    def get_all_items(self):
+        """Return every item row ordered by name, cached until items change"""
+        if self._all_items_cache is None:
+            self._all_items_cache = self.db_manager.execute_query(
+                ITEM_ROW_QUERY + "ORDER BY i.name", fetch=True) or []
+        return self._all_items_cache
+    
     def load_all_items(self):
         """Load items with quantity > 0 into the table"""
-        items = self.db_manager.execute_query("""
-            SELECT i.id, i.name, c.name, i.quantity, i.price, i.min_stock, 
-                   i.supplier, i.barcode, i.date_added
-            FROM items i
-            LEFT JOIN categories c ON i.category_id = c.id
-            WHERE i.quantity > 0
-            ORDER BY i.name
-        """, fetch=True)
-        
-        if items:
-            self.all_items_table.setRowCount(len(items))
-            self.all_items_table.setColumnCount(9)
-            self.all_items_table.setHorizontalHeaderLabels([
-                "ID", "Name", "Category", "Quantity", "Price", "Min Stock", 
-                "Supplier", "Barcode", "Date Added"
-            ])
-            
-            for row, item in enumerate(items):
-                for col, value in enumerate(item):
-                    item_widget = QTableWidgetItem(str(value) if value is not None else "")
-                    self.all_items_table.setItem(row, col, item_widget)
-            
-            self.all_items_table.resizeColumnsToContents()
-        else:
-            self.all_items_table.setRowCount(0)
+        self.items_model.set_rows(
+            item for item in self.get_all_items()
+            if item["quantity"] is not None and item["quantity"] > 0)
     
     def load_low_stock_items(self):
-        """Load items with quantity = 0 (without barcode)"""
-        low_stock_items = self.db_manager.execute_query("""
-            SELECT i.id, i.name, c.name, i.quantity, i.price, i.min_stock, i.supplier
-            FROM items i
-            LEFT JOIN categories c ON i.category_id = c.id
-            WHERE i.quantity = 0
-            ORDER BY i.name
-        """, fetch=True)
-        
-        if low_stock_items:
-            self.low_stock_table.setRowCount(len(low_stock_items))
-            self.low_stock_table.setColumnCount(7)
-            self.low_stock_table.setHorizontalHeaderLabels([
-                "ID", "Name", "Category", "Quantity", "Price", "Min Stock", "Supplier"
-            ])
-            
-            for row, item in enumerate(low_stock_items):
-                for col, value in enumerate(item):
-                    item_widget = QTableWidgetItem(str(value) if value is not None else "")
-                    # Highlight all cells in red for low stock items
-                    item_widget.setBackground(QColor("#ffebee"))
-                    item_widget.setForeground(QColor("#c62828"))
-                    self.low_stock_table.setItem(row, col, item_widget)
-            
-            self.low_stock_table.resizeColumnsToContents()
-        else:
-            self.low_stock_table.setRowCount(0)
-            self.low_stock_table.setColumnCount(7)
-            self.low_stock_table.setHorizontalHeaderLabels([
-                "ID", "Name", "Category", "Quantity", "Price", "Min Stock", "Supplier"
-            ])
+        """Load items with quantity = 0 (barcode and date columns are not displayed)"""
+        self.low_stock_model.set_rows(
+            item for item in self.get_all_items() if item["quantity"] == 0)
     
-    def load_categories(self):
-        """Load categories for dropdown"""
-        categories = self.db_manager.execute_query("SELECT id, name FROM categories", fetch=True)
-        self.categories = categories or []
-        
-        self.item_category.clear()
-        self.item_category.addItem("Select Category", 0)
-        for cat_id, cat_name in self.categories:
-            self.item_category.addItem(cat_name, cat_id)
+    def reload_items(self):
+        """Drop the cached item rows and reload both items tables from the database"""
+        self._all_items_cache = None
+        self.load_all_items()
+        self.load_low_stock_items()
     
     def add_item(self):
         """Add new item to inventory"""
@@ -627,10 +889,13 @@ class InventoryApp(QMainWindow, StyledWidget):
             if reply != QMessageBox.Yes:
                 return
         
-        self.db_manager.execute_query("""
+        query = """
             INSERT INTO items (name, category_id, quantity, price, min_stock, supplier, barcode, date_added)
             VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
+        """
+        if SQLITE_HAS_RETURNING:
+            query += ITEM_ROW_RETURNING
+        result = self.db_manager.execute_query(query, (
             self.item_name.text(),
             category_id,
             quantity,
@@ -639,16 +904,16 @@ class InventoryApp(QMainWindow, StyledWidget):
             self.item_supplier.text(),
             self.item_barcode.text(),
             datetime.now().strftime("%Y-%m-%d")
-        ), audit_user=self.current_user_id, audit_action="ADD_ITEM", 
+        ), fetch=SQLITE_HAS_RETURNING, audit_user=self.current_user_id, audit_action="ADD_ITEM", 
         audit_details=f"Added item: {self.item_name.text()}")
         
         QMessageBox.information(self, "Success", "Item added successfully!")
         self.clear_item_form()
-        self.refresh_all_data()
+        self.apply_item_change(result)
     
     def update_item(self):
         """Update selected item"""
-        current_row = self.all_items_table.currentRow()
+        current_row = self.all_items_table.currentIndex().row()
         if current_row < 0:
             QMessageBox.warning(self, "Error", "Please select an item to update!")
             return
@@ -661,7 +926,7 @@ class InventoryApp(QMainWindow, StyledWidget):
             QMessageBox.warning(self, "Error", "Please select a category!")
             return
         
-        item_id = self.all_items_table.item(current_row, 0).text()
+        item_id = self.items_model.row_data(current_row)["id"]
         
         # Check if quantity is being changed to 0
         quantity = self.item_quantity.value()
@@ -672,10 +937,13 @@ class InventoryApp(QMainWindow, StyledWidget):
             if reply != QMessageBox.Yes:
                 return
         
-        self.db_manager.execute_query("""
+        query = """
             UPDATE items SET name=?, category_id=?, quantity=?, price=?, min_stock=?, supplier=?, barcode=?
             WHERE id=?
-        """, (
+        """
+        if SQLITE_HAS_RETURNING:
+            query += ITEM_ROW_RETURNING
+        result = self.db_manager.execute_query(query, (
             self.item_name.text(),
             category_id,
             quantity,
@@ -684,22 +952,22 @@ class InventoryApp(QMainWindow, StyledWidget):
             self.item_supplier.text(),
             self.item_barcode.text(),
             item_id
-        ), audit_user=self.current_user_id, audit_action="UPDATE_ITEM", 
+        ), fetch=SQLITE_HAS_RETURNING, audit_user=self.current_user_id, audit_action="UPDATE_ITEM", 
         audit_details=f"Updated item ID: {item_id}")
         
         QMessageBox.information(self, "Success", "Item updated successfully!")
         self.clear_item_form()
-        self.refresh_all_data()
+        self.apply_item_change(result, replaced_row=current_row)
     
     def delete_item(self):
         """Delete selected item"""
-        current_row = self.all_items_table.currentRow()
+        current_row = self.all_items_table.currentIndex().row()
         if current_row < 0:
             QMessageBox.warning(self, "Error", "Please select an item to delete!")
             return
         
-        item_id = self.all_items_table.item(current_row, 0).text()
-        item_name = self.all_items_table.item(current_row, 1).text()
+        item = self.items_model.row_data(current_row)
+        item_id, item_name = item["id"], item["name"]
         
         reply = QMessageBox.question(self, "Confirm Delete", 
                                    f"Are you sure you want to delete '{item_name}'?",
@@ -710,30 +978,42 @@ class InventoryApp(QMainWindow, StyledWidget):
                                         audit_user=self.current_user_id, audit_action="DELETE_ITEM", 
                                         audit_details=f"Deleted item: {item_name}")
             QMessageBox.information(self, "Success", "Item deleted successfully!")
+            self._all_items_cache = None
+            self.items_model.remove_row(current_row)
+            self.load_chart_data()
+    
+    def apply_item_change(self, result, replaced_row=None):
+        """Patch the items tables with the row returned by an INSERT/UPDATE"""
+        self._all_items_cache = None
+        if not result:
+            # No RETURNING support (SQLite < 3.35) or the write failed
             self.refresh_all_data()
+            return
+        row = result[0]
+        # An UPDATE replaces the All Items row it was edited from; an INSERT has none
+        if replaced_row is not None:
+            self.items_model.remove_row(replaced_row)
+        if row["quantity"] == 0:
+            self.low_stock_model.insert_row(row)
+        elif row["quantity"] is not None and row["quantity"] > 0:
+            self.items_model.insert_row(row)
+        self.load_chart_data()
     
-    def load_item_for_edit(self, row, column):
-        """Load selected item data into form for editing"""
-        item_id = self.all_items_table.item(row, 0).text()
-        item = self.db_manager.execute_query(
-            "SELECT name, category_id, quantity, price, min_stock, supplier, barcode FROM items WHERE id=?",
-            (item_id,), fetch=True)
-        
-        if item:
-            item_data = item[0]
-            self.item_name.setText(item_data[0] or "")
-            
-            # Set category
-            for i in range(self.item_category.count()):
-                if self.item_category.itemData(i) == item_data[1]:
-                    self.item_category.setCurrentIndex(i)
-                    break
-            
-            self.item_quantity.setValue(item_data[2] or 0)
-            self.item_price.setValue(item_data[3] or 0.0)
-            self.item_min_stock.setValue(item_data[4] or 0)
-            self.item_supplier.setText(item_data[5] or "")
-            self.item_barcode.setText(item_data[6] or "")
+    def load_item_for_edit(self, index):
+        """Load selected item data into form from the row already in the table"""
+        item = self.items_model.row_data(index.row())
+        self.item_name.setText(item["name"] or "")
+        
+        # Set category
+        category_index = self.item_category.findData(item["category_id"])
+        if category_index >= 0:
+            self.item_category.setCurrentIndex(category_index)
+        
+        self.item_quantity.setValue(item["quantity"] or 0)
+        self.item_price.setValue(item["price"] or 0.0)
+        self.item_min_stock.setValue(item["min_stock"] or 0)
+        self.item_supplier.setText(item["supplier"] or "")
+        self.item_barcode.setText(item["barcode"] or "")
     
     def validate_item_form(self):
         """Validate item form inputs"""
@@ -756,22 +1036,25 @@ class InventoryApp(QMainWindow, StyledWidget):
         """Refresh all data tables and dashboard"""
         self.load_all_items()
         self.load_low_stock_items()
-        self.load_categories_table()
+        self._refresh_categories()
         self.load_chart_data()
     
     def clean_invalid_records(self):
-        """Clean invalid records from database"""
-        try:
-            # Remove items with empty or null names
-            self.db_manager.execute_query(
-                "DELETE FROM items WHERE name IS NULL OR TRIM(name) = ''",
-                audit_user=self.current_user_id, 
-                audit_action="CLEAN_DATABASE", 
-                audit_details="Removed invalid item records"
-            )
-            print("Database cleaned: Invalid records removed")
-        except Exception as e:
-            print(f"Error cleaning database: {e}")
+        """Clean invalid records from database in the background"""
+        # Remove items with empty or null names
+        self.run_in_background(
+            self.on_records_cleaned,
+            self.db_manager.execute_query,
+            "DELETE FROM items WHERE name IS NULL OR TRIM(name) = ''",
+            audit_user=self.current_user_id, 
+            audit_action="CLEAN_DATABASE", 
+            audit_details="Removed invalid item records"
+        )
+    
+    def on_records_cleaned(self, result):
+        """Drop cached item rows once the cleanup has committed"""
+        self._all_items_cache = None
+        print("Database cleaned: Invalid records removed")
      
     def create_categories_tab(self):
         """Create categories management tab"""
@@ -805,35 +1088,43 @@ class InventoryApp(QMainWindow, StyledWidget):
         form_group.setLayout(form_layout)
         
         # Categories table
-        self.categories_table = QTableWidget()
+        self.categories_model = RowTableModel(["ID", "Name", "Description"])
+        self.categories_table = QTableView()
+        self.categories_table.setModel(self.categories_model)
         self.categories_table.setSelectionBehavior(QAbstractItemView.SelectRows)
-        self.categories_table.cellClicked.connect(self.load_category_for_edit)
+        self.categories_table.clicked.connect(self.load_category_for_edit)
+        self.set_column_widths(self.categories_table, [50, 200, 400])
         
         layout.addWidget(form_group)
         layout.addWidget(self.categories_table)
         
-        # Load categories
-        self.load_categories_table()
-        
         widget.setLayout(layout)
         return widget
     
-    def load_categories_table(self):
-        """Load categories into table"""
-        categories = self.db_manager.execute_query("SELECT id, name, description FROM categories", fetch=True)
-        
-        if categories:
-            self.categories_table.setRowCount(len(categories))
-            self.categories_table.setColumnCount(3)
-            self.categories_table.setHorizontalHeaderLabels(["ID", "Name", "Description"])
-            
-            for row, category in enumerate(categories):
-                for col, value in enumerate(category):
-                    self.categories_table.setItem(row, col, QTableWidgetItem(str(value) if value else ""))
-            
-            self.categories_table.resizeColumnsToContents()
-        else:
-            self.categories_table.setRowCount(0)
+    def get_categories(self):
+        """Return every category row, cached until categories change"""
+        if self._categories_cache is None:
+            self._categories_cache = self.db_manager.execute_query(
+                CATEGORY_ROW_QUERY, fetch=True) or []
+        return self._categories_cache
+    
+    def get_category_names(self):
+        """Return the cached {category id: name} map used in place of a categories join"""
+        if self._category_name_map is None:
+            self._category_name_map = {row[0]: row[1] for row in self.get_categories()}
+        return self._category_name_map
+    
+    def _refresh_categories(self):
+        """Fill the categories table and the item category dropdown from one cached fetch"""
+        rows = self.get_categories()
+        self.categories_model.set_rows(rows)
+        
+        self.item_category.blockSignals(True)
+        self.item_category.clear()
+        self.item_category.addItem("Select Category", 0)
+        for row in rows:
+            self.item_category.addItem(row["name"], row["id"])
+        self.item_category.blockSignals(False)
     
     def add_category(self):
         """Add new category"""
@@ -842,21 +1133,29 @@ class InventoryApp(QMainWindow, StyledWidget):
             QMessageBox.warning(self, "Error", "Category name is required!")
             return
         
-        self.db_manager.execute_query(
-            "INSERT INTO categories (name, description) VALUES (?, ?)",
-            (name, self.category_description.text()),
+        result = self.db_manager.execute_query(
+            CATEGORY_INSERT_RETURNING if SQLITE_HAS_RETURNING else CATEGORY_INSERT,
+            (name, self.category_description.text()), fetch=SQLITE_HAS_RETURNING,
             audit_user=self.current_user_id, audit_action="ADD_CATEGORY", 
             audit_details=f"Added category: {name}")
         
         QMessageBox.information(self, "Success", "Category added successfully!")
         self.category_name.clear()
         self.category_description.clear()
-        self.load_categories_table()
-        self.load_categories()  # Refresh dropdown
+        self._category_name_map = None
+        if result and self._categories_cache is not None:
+            # Append the inserted row instead of reselecting or resetting the table
+            category = result[0]
+            self._categories_cache.append(category)
+            self.categories_model.append_row(category)
+            self.item_category.addItem(category["name"], category["id"])
+        else:
+            self._categories_cache = None
+            self._refresh_categories()
     
     def update_category(self):
         """Update selected category"""
-        current_row = self.categories_table.currentRow()
+        current_row = self.categories_table.currentIndex().row()
         if current_row < 0:
             QMessageBox.warning(self, "Error", "Please select a category to update!")
             return
@@ -866,10 +1165,10 @@ class InventoryApp(QMainWindow, StyledWidget):
             QMessageBox.warning(self, "Error", "Category name is required!")
             return
         
-        category_id = self.categories_table.item(current_row, 0).text()
+        category_id = self.categories_model.row_data(current_row)["id"]
         
         self.db_manager.execute_query(
-            "UPDATE categories SET name=?, description=? WHERE id=?",
+            CATEGORY_UPDATE,
             (name, self.category_description.text(), category_id),
             audit_user=self.current_user_id, audit_action="UPDATE_CATEGORY", 
             audit_details=f"Updated category ID: {category_id}")
@@ -877,43 +1176,49 @@ class InventoryApp(QMainWindow, StyledWidget):
         QMessageBox.information(self, "Success", "Category updated successfully!")
         self.category_name.clear()
         self.category_description.clear()
-        self.load_categories_table()
-        self.load_categories()  # Refresh dropdown
+        self._categories_cache = None
+        self._category_name_map = None
+        self._all_items_cache = None
+        self._refresh_categories()
     
     def delete_category(self):
         """Delete selected category"""
-        current_row = self.categories_table.currentRow()
+        current_row = self.categories_table.currentIndex().row()
         if current_row < 0:
             QMessageBox.warning(self, "Error", "Please select a category to delete!")
             return
         
-        category_id = self.categories_table.item(current_row, 0).text()
-        category_name = self.categories_table.item(current_row, 1).text()
+        category = self.categories_model.row_data(current_row)
+        category_id, category_name = category["id"], category["name"]
         
         # Check if category has items
-        items_count = self.db_manager.execute_query(
-            "SELECT COUNT(*) FROM items WHERE category_id=?", (category_id,), fetch=True)
+        items_count = self.db_manager.count("items", "category_id=?", (category_id,))
         
-        if items_count and items_count[0][0] > 0:
-            QMessageBox.warning(self, "Error", f"Cannot delete category '{category_name}' as it has {items_count[0][0]} items associated with it!")
+        if items_count > 0:
+            QMessageBox.warning(self, "Error", f"Cannot delete category '{category_name}' as it has {items_count} items associated with it!")
             return
         
-        reply = QMessageBox.question(self, "Confirm Delete", f"Are you sure you want to delete category '{category_name}'?", QMessageBox.Yes | QMessageBox.No)
-        
-        if reply == QMessageBox.Yes:
-            self.db_manager.execute_query("DELETE FROM categories WHERE id=?", (category_id,), audit_user=self.current_user_id, audit_action="DELETE_CATEGORY", audit_details=f"Deleted category: {category_name}")
-            QMessageBox.information(self, "Success", "Category deleted successfully!")
-            self.load_categories_table()
-            self.load_categories()  # Refresh dropdown
+        # Window-modal confirm opened without a nested event loop
+        box = QMessageBox(QMessageBox.Question, "Confirm Delete", f"Are you sure you want to delete category '{category_name}'?", QMessageBox.Yes | QMessageBox.No, self)
+        box.setAttribute(Qt.WA_DeleteOnClose)
+        box.buttonClicked.connect(
+            lambda button: self._do_delete_category(category_id, category_name)
+            if box.standardButton(button) == QMessageBox.Yes else None)
+        box.open()
     
-    def load_category_for_edit(self, row, column):
-        """Load selected category for editing"""
-        category_id = self.categories_table.item(row, 0).text()
-        category = self.db_manager.execute_query("SELECT name, description FROM categories WHERE id=?", (category_id,), fetch=True)
-        
-        if category:
-            self.category_name.setText(category[0][0] or "")
-            self.category_description.setText(category[0][1] or "")
+    def _do_delete_category(self, category_id, category_name):
+        """Delete a category once the user has confirmed"""
+        self.db_manager.execute_query(CATEGORY_DELETE, (category_id,), audit_user=self.current_user_id, audit_action="DELETE_CATEGORY", audit_details=f"Deleted category: {category_name}")
+        QMessageBox.information(self, "Success", "Category deleted successfully!")
+        self._categories_cache = None
+        self._category_name_map = None
+        self._refresh_categories()
+    
+    def load_category_for_edit(self, index):
+        """Load selected category for editing from the row already in the table"""
+        category = self.categories_model.row_data(index.row())
+        self.category_name.setText(category["name"] or "")
+        self.category_description.setText(category["description"] or "")
 
     def create_reports_tab(self):
         """Create reports tab with enhanced low stock alerts"""
@@ -950,148 +1255,154 @@ class InventoryApp(QMainWindow, StyledWidget):
         """Generate detailed low stock report with alerts"""
         self.report_text.clear()
         
-        # Get items with quantity = 0 (excluding empty/null names)
-        low_stock_items = self.db_manager.execute_query("""
-            SELECT i.name, c.name, i.quantity, i.price, i.min_stock, i.supplier
-            FROM items i
-            LEFT JOIN categories c ON i.category_id = c.id
-            WHERE i.quantity = 0 AND i.name IS NOT NULL AND TRIM(i.name) != ''
-            ORDER BY i.name
-        """, fetch=True)
+        try:
+            # Get items with quantity = 0 (excluding empty/null names)
+            low_stock_items = self.db_manager.fetch_rows("""
+                SELECT i.name, i.category_id, i.quantity, i.price, i.min_stock, i.supplier
+                FROM items i
+                WHERE i.quantity = 0 AND i.name IS NOT NULL AND TRIM(i.name) != ''
+                ORDER BY i.name
+            """)
+            
+            # Also check items with low stock (quantity <= min_stock but > 0)
+            warning_items = self.db_manager.fetch_rows("""
+                SELECT i.name, i.category_id, i.quantity, i.min_stock, i.price
+                FROM items i
+                WHERE i.quantity > 0 AND i.quantity <= i.min_stock AND i.name IS NOT NULL AND TRIM(i.name) != ''
+                ORDER BY i.quantity ASC
+            """)
+        except sqlite3.Error as e:
+            QMessageBox.critical(self, "Error", f"Failed to generate report: {str(e)}")
+            return
         
-        report = f"""
-╔══════════════════════════════════════════════════════════════════════════════════════╗
+        # Blocks come back empty when their query had no rows
+        category_names = self.get_category_names()
+        parts = [self._low_stock_header()]
+        parts.append(self._critical_block(low_stock_items, category_names) or _OK_BLOCK)
+        parts.append(self._warning_block(warning_items, category_names))
+        
+        self.report_text.setPlainText("".join(parts))
+    
+    def _low_stock_header(self):
+        """Banner and identification block of the low stock report"""
+        return f"""
+{_BOX_TOP}
 ║                          CRITICAL STOCK DEPLETION ALERT                             ║
 ║                          IMMEDIATE EXECUTIVE ATTENTION REQUIRED                     ║
-╚══════════════════════════════════════════════════════════════════════════════════════╝
+{_BOX_BOT}
 
 REPORT IDENTIFICATION
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+{_SEP_THICK}
 Generation Timestamp: {datetime.now().strftime("%Y-%m-%d %H:%M:%S UTC")}
 Report Classification: URGENT - OUT OF STOCK INVENTORY ANALYSIS
 Business Impact Level: CRITICAL - REVENUE AFFECTING
 
 EXECUTIVE SUMMARY
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+{_SEP_THICK}
 ⚠️  ZERO INVENTORY ITEMS DETECTED - IMMEDIATE SUPPLY CHAIN INTERVENTION REQUIRED
 
         """
-        
-        if low_stock_items:
-            report += f"Critical Items Count: {len(low_stock_items)} products require immediate procurement action\n\n"
-            
-            # Calculate financial impact
-            total_value = sum((item[3] or 0) for item in low_stock_items)
-            potential_revenue_loss = total_value * 0.25  # Assuming 25% margin loss
-            
-            report += f"FINANCIAL IMPACT ASSESSMENT\n"
-            report += f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n"
-            report += f"Total Product Value at Risk: ${total_value:,.2f}\n"
-            report += f"Estimated Revenue Impact: ${potential_revenue_loss:,.2f}\n"
-            report += f"Supply Chain Disruption Level: HIGH\n\n"
-            
-            report += "DETAILED INVENTORY DEPLETION ANALYSIS\n"
-            report += "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n"
-            report += f"{'PRODUCT IDENTIFIER':<30} {'CLASSIFICATION':<20} {'QTY':<6} {'UNIT VALUE':<12} {'REORDER LVL':<12} {'SUPPLIER':<20}\n"
-            report += "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n"
-            
-            for item in low_stock_items:
-                name, category, quantity, price, min_stock, supplier = item
-                product_name = (name or "UNNAMED_PRODUCT")[:29]
-                category_name = (category or "UNCATEGORIZED")[:19]
-                supplier_name = (supplier or "UNASSIGNED")[:19]
-                
-                report += f"{product_name:<30} {category_name:<20} {quantity:<6} ${price or 0:<11.2f} {min_stock or 0:<12} {supplier_name:<20}\n"
-            
-            report += "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n\n"
-            
-            report += "EXECUTIVE ACTION REQUIREMENTS\n"
-            report += "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n"
-            report += "PRIORITY 1 (IMMEDIATE - NEXT 24 HOURS):\n"
-            report += "• Initiate emergency supplier communication protocols\n"
-            report += "• Activate expedited procurement procedures\n"
-            report += "• Issue stock depletion notifications to sales operations\n\n"
-            report += "PRIORITY 2 (SHORT-TERM - NEXT 72 HOURS):\n"
-            report += "• Evaluate alternative supplier arrangements\n"
-            report += "• Assess customer impact and communication strategy\n"
-            report += "• Review procurement forecasting models\n\n"
-            report += "PRIORITY 3 (STRATEGIC - NEXT 7 DAYS):\n"
-            report += "• Conduct supply chain resilience assessment\n"
-            report += "• Implement enhanced inventory monitoring protocols\n"
-            report += "• Update minimum stock level parameters\n\n"
-        else:
-            report += "OPERATIONAL STATUS: OPTIMAL\n"
-            report += "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n"
-            report += "✅ EXCELLENT: All inventory items maintain positive stock levels\n"
-            report += "✅ Supply chain operations performing within acceptable parameters\n"
-            report += "✅ No immediate procurement actions required\n\n"
-            report += "RECOMMENDATION: Continue standard inventory monitoring protocols\n\n"
-        
-        # Also check items with low stock (quantity <= min_stock but > 0)
-        warning_items = self.db_manager.execute_query("""
-            SELECT i.name, c.name, i.quantity, i.min_stock, i.price
-            FROM items i
-            LEFT JOIN categories c ON i.category_id = c.id
-            WHERE i.quantity > 0 AND i.quantity <= i.min_stock AND i.name IS NOT NULL AND TRIM(i.name) != ''
-            ORDER BY i.quantity ASC
-        """, fetch=True)
-        
-        if warning_items:
-            report += f"SECONDARY RISK ASSESSMENT - LOW INVENTORY WARNING\n"
-            report += f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n"
-            report += f"Items Operating Below Minimum Threshold: {len(warning_items)} products\n"
-            report += f"Risk Level: MEDIUM - Proactive procurement recommended\n\n"
-            
-            for item in warning_items:
-                name, category, quantity, min_stock, price = item
-                product_name = (name or "UNNAMED_PRODUCT")[:25]
-                category_name = (category or "UNCATEGORIZED")[:15]
-                report += f"• {product_name} ({category_name}): Current Stock: {quantity} | Minimum Required: {min_stock} | Unit Value: ${price or 0:.2f}\n"
-        
-        self.report_text.setPlainText(report)
+    
+    def _critical_block(self, items, category_names):
+        """Financial impact, item table and action plan for out-of-stock items ("" if none)"""
+        # Rows are formatted and totalled in one pass; the summary lines need the totals first
+        lines = []
+        total_value = 0
+        for name, category_id, quantity, price, min_stock, supplier in items:
+            total_value += price or 0
+            lines.append(f"{_fit(name, 30, 'UNNAMED_PRODUCT')} {_fit(category_names.get(category_id), 20, 'UNCATEGORIZED')} "
+                         f"{quantity:<6} ${price or 0:<11.2f} {min_stock or 0:<12} {_fit(supplier, 20, 'UNASSIGNED')}\n")
+        if not lines:
+            return ""
+        
+        parts = []
+        w = parts.append
+        w(f"Critical Items Count: {len(lines)} products require immediate procurement action\n\n")
+        
+        # Calculate financial impact
+        potential_revenue_loss = total_value * 0.25  # Assuming 25% margin loss
+        
+        w(f"FINANCIAL IMPACT ASSESSMENT\n")
+        w(f"{_SEP_THICK}\n")
+        w(f"Total Product Value at Risk: ${total_value:,.2f}\n")
+        w(f"Estimated Revenue Impact: ${potential_revenue_loss:,.2f}\n")
+        w(f"Supply Chain Disruption Level: HIGH\n\n")
+        
+        w("DETAILED INVENTORY DEPLETION ANALYSIS\n")
+        w(f"{_SEP_THICK}\n")
+        w(f"{'PRODUCT IDENTIFIER':<30} {'CLASSIFICATION':<20} {'QTY':<6} {'UNIT VALUE':<12} {'REORDER LVL':<12} {'SUPPLIER':<20}\n")
+        w(f"{_SEP_THICK}\n")
+        parts.extend(lines)
+        w(f"{_SEP_THICK}\n\n")
+        
+        w(_ACTION_BLOCK)
+        return "".join(parts)
+    
+    def _warning_block(self, items, category_names):
+        """Summary lines for items below their minimum stock ("" if none)"""
+        lines = []
+        for name, category_id, quantity, min_stock, price in items:
+            product_name = (name or "UNNAMED_PRODUCT")[:25]
+            category_name = (category_names.get(category_id) or "UNCATEGORIZED")[:15]
+            lines.append(f"• {product_name} ({category_name}): Current Stock: {quantity} | Minimum Required: {min_stock} | Unit Value: ${price or 0:.2f}\n")
+        if not lines:
+            return ""
+        
+        return "".join([
+            f"SECONDARY RISK ASSESSMENT - LOW INVENTORY WARNING\n",
+            f"{_SEP_THICK}\n",
+            f"Items Operating Below Minimum Threshold: {len(lines)} products\n",
+            f"Risk Level: MEDIUM - Proactive procurement recommended\n\n",
+            *lines,
+        ])
     
     def generate_full_inventory_report(self):
         """Generate full inventory report with low stock alerts"""
         self.report_text.clear()
+        parts = []
+        w = parts.append
         
-        all_items = self.db_manager.execute_query("""
-            SELECT i.name, c.name, i.quantity, i.price, i.min_stock, i.supplier, i.barcode, i.date_added
-            FROM items i
-            LEFT JOIN categories c ON i.category_id = c.id
-            WHERE i.name IS NOT NULL AND TRIM(i.name) != ''
-            ORDER BY i.name
-        """, fetch=True)
+        # name, category, quantity, price, min_stock, supplier, barcode, date_added, value, status
+        all_items = [item[1:11] for item in self.get_all_items()
+                     if item["name"] is not None and item["name"].strip(" ")]
         
-        report = f"""
-╔══════════════════════════════════════════════════════════════════════════════════════╗
+        w(f"""
+{_BOX_TOP}
 ║                        COMPREHENSIVE INVENTORY ANALYSIS REPORT                      ║
 ║                              STRATEGIC OVERVIEW & INSIGHTS                          ║
-╚══════════════════════════════════════════════════════════════════════════════════════╝
+{_BOX_BOT}
 
 REPORT METADATA
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+{_SEP_THICK}
 Generation Timestamp: {datetime.now().strftime("%Y-%m-%d %H:%M:%S UTC")}
 Report Classification: COMPREHENSIVE INVENTORY ASSESSMENT
 Analysis Scope: COMPLETE PRODUCT PORTFOLIO
 Authorized Personnel: C-LEVEL EXECUTIVES & OPERATIONS MANAGEMENT
 
-        """
+        """)
         
         if all_items:
-            # Summary statistics
+            # Summary statistics, gathered in a single pass
+            out_of_stock_items = []
+            low_stock = 0
+            total_value = 0
+            for item in all_items:
+                total_value += item[8]
+                if item[9] == 0:
+                    out_of_stock_items.append(item)
+                elif item[9] == 1:
+                    low_stock += 1
             total_items = len(all_items)
-            out_of_stock = len([item for item in all_items if item[2] == 0])
-            low_stock = len([item for item in all_items if item[2] > 0 and item[2] <= (item[4] or 0)])
-            total_value = sum((item[2] or 0) * (item[3] or 0) for item in all_items)
+            out_of_stock = len(out_of_stock_items)
             available_items = total_items - out_of_stock
             
-            report += f"STRATEGIC INVENTORY PERFORMANCE METRICS\n"
-            report += f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n"
-            report += f"Total Product Portfolio: {total_items:,} SKUs\n"
-            report += f"Available Inventory: {available_items:,} products ({(available_items/total_items*100) if total_items > 0 else 0:.1f}%)\n"
-            report += f"Critical Stock Depletion: {out_of_stock:,} products ({(out_of_stock/total_items*100) if total_items > 0 else 0:.1f}%)\n"
-            report += f"Below Minimum Threshold: {low_stock:,} products ({(low_stock/total_items*100) if total_items > 0 else 0:.1f}%)\n"
-            report += f"Total Portfolio Valuation: ${total_value:,.2f}\n"
+            w(f"STRATEGIC INVENTORY PERFORMANCE METRICS\n")
+            w(f"{_SEP_THICK}\n")
+            w(f"Total Product Portfolio: {total_items:,} SKUs\n")
+            w(f"Available Inventory: {available_items:,} products ({(available_items/total_items*100) if total_items > 0 else 0:.1f}%)\n")
+            w(f"Critical Stock Depletion: {out_of_stock:,} products ({(out_of_stock/total_items*100) if total_items > 0 else 0:.1f}%)\n")
+            w(f"Below Minimum Threshold: {low_stock:,} products ({(low_stock/total_items*100) if total_items > 0 else 0:.1f}%)\n")
+            w(f"Total Portfolio Valuation: ${total_value:,.2f}\n")
             
             # Risk assessment
             risk_level = "LOW"
@@ -1103,78 +1414,74 @@ Authorized Personnel: C-LEVEL EXECUTIVES & OPERATIONS MANAGEMENT
                 risk_level = "HIGH"
                 risk_color = "🟡"
             
-            report += f"Supply Chain Risk Assessment: {risk_color} {risk_level}\n\n"
+            w(f"Supply Chain Risk Assessment: {risk_color} {risk_level}\n\n")
             
             # Alert section for critical items
             if out_of_stock > 0:
-                report += f"CRITICAL OPERATIONAL ALERTS\n"
-                report += f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n"
-                report += f"🔴 IMMEDIATE ATTENTION: {out_of_stock} products completely depleted\n"
-                out_of_stock_items = [item for item in all_items if item[2] == 0]
+                w(f"CRITICAL OPERATIONAL ALERTS\n")
+                w(f"{_SEP_THICK}\n")
+                w(f"🔴 IMMEDIATE ATTENTION: {out_of_stock} products completely depleted\n")
                 
-                report += f"High-Priority Restocking Requirements:\n"
+                w(f"High-Priority Restocking Requirements:\n")
                 for item in out_of_stock_items[:5]:  # Show first 5
                     product_name = (item[0] or "UNNAMED_PRODUCT")[:25]
                     category_name = (item[1] or "UNCATEGORIZED")[:15]
-                    report += f"   • {product_name} | {category_name} | Unit Value: ${item[3] or 0:.2f}\n"
+                    w(f"   • {product_name} | {category_name} | Unit Value: ${item[3] or 0:.2f}\n")
                 if len(out_of_stock_items) > 5:
-                    report += f"   ... and {len(out_of_stock_items) - 5} additional critical items requiring procurement\n"
-                report += "\n"
+                    w(f"   ... and {len(out_of_stock_items) - 5} additional critical items requiring procurement\n")
+                w("\n")
             
             # Full inventory listing
-            report += "COMPLETE INVENTORY PORTFOLIO ANALYSIS\n"
-            report += "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n"
-            report += f"{'STATUS':<8} {'PRODUCT IDENTIFIER':<30} {'CLASSIFICATION':<20} {'QTY':<6} {'MIN':<6} {'UNIT VALUE':<12} {'TOTAL VALUE':<12} {'SUPPLIER':<20}\n"
-            report += "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n"
+            w("COMPLETE INVENTORY PORTFOLIO ANALYSIS\n")
+            w(f"{_SEP_WIDE}\n")
+            w(f"{'STATUS':<8} {'PRODUCT IDENTIFIER':<30} {'CLASSIFICATION':<20} {'QTY':<6} {'MIN':<6} {'UNIT VALUE':<12} {'TOTAL VALUE':<12} {'SUPPLIER':<20}\n")
+            w(f"{_SEP_WIDE}\n")
             
             for item in all_items:
-                name, category, quantity, price, min_stock, supplier, barcode, date_added = item
-                value = (quantity or 0) * (price or 0)
+                name, category, quantity, price, min_stock, supplier, barcode, date_added, value, status_code = item
                 
                 # Add professional status indicators
-                status = ""
-                status_text = ""
-                if quantity == 0:
-                    status = "🔴"
-                    status_text = "DEPLETED"
-                elif quantity <= (min_stock or 0) and quantity > 0:
-                    status = "🟡"
-                    status_text = "LOW"
-                else:
-                    status = "🟢"
-                    status_text = "NORMAL"
+                status = STOCK_STATUS_ICONS[status_code]
+                status_text = STOCK_STATUS_LABELS[status_code]
                 
-                product_name = (name or "UNNAMED_PRODUCT")[:29]
-                category_name = (category or "UNCATEGORIZED")[:19]
-                supplier_name = (supplier or "UNASSIGNED")[:19]
-                
-                report += f"{status} {status_text:<6} {product_name:<30} {category_name:<20} {quantity:<6} {min_stock or 0:<6} ${price or 0:<11.2f} ${value:<11.2f} {supplier_name:<20}\n"
+                w(f"{status} {status_text:<6} {_fit(name, 30, 'UNNAMED_PRODUCT')} {_fit(category, 20, 'UNCATEGORIZED')} "
+                  f"{quantity:<6} {min_stock or 0:<6} ${price or 0:<11.2f} ${value:<11.2f} {_fit(supplier, 20, 'UNASSIGNED')}\n")
             
-            report += "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n\n"
+            w(f"{_SEP_WIDE}\n\n")
             
             # Professional legend
-            report += "OPERATIONAL STATUS CLASSIFICATION\n"
-            report += "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n"
-            report += "🔴 DEPLETED: Zero inventory - Immediate procurement required\n"
-            report += "🟡 LOW: Below minimum threshold - Proactive restocking recommended\n"
-            report += "🟢 NORMAL: Adequate inventory levels - Standard monitoring protocols\n\n"
+            w("OPERATIONAL STATUS CLASSIFICATION\n")
+            w(f"{_SEP_THICK}\n")
+            w("🔴 DEPLETED: Zero inventory - Immediate procurement required\n")
+            w("🟡 LOW: Below minimum threshold - Proactive restocking recommended\n")
+            w("🟢 NORMAL: Adequate inventory levels - Standard monitoring protocols\n\n")
             
         else:
-            report += "No items found in inventory.\n"
+            w("No items found in inventory.\n")
         
-        self.report_text.setPlainText(report)
+        self.report_text.setPlainText("".join(parts))
     
     def generate_category_report(self):
         """Generate category-wise report"""
         self.report_text.clear()
         
-        categories = self.db_manager.execute_query("""
-            SELECT c.name, COUNT(i.id), SUM(i.quantity), SUM(i.quantity * i.price)
-            FROM categories c
-            LEFT JOIN items i ON c.id = i.category_id
-            GROUP BY c.id, c.name
-            ORDER BY c.name
-        """, fetch=True)
+        # Per-category rows followed by a grand total row, aggregated in one scan
+        rows = self.db_manager.execute_query("""
+            SELECT name, item_count, quantity, value FROM (
+                SELECT 0 AS grp, c.name AS name, COUNT(i.id) AS item_count,
+                       COALESCE(SUM(i.quantity), 0) AS quantity,
+                       COALESCE(SUM(i.quantity * i.price), 0) AS value
+                FROM categories c
+                LEFT JOIN items i ON c.id = i.category_id
+                GROUP BY c.id, c.name
+                UNION ALL
+                SELECT 1, 'TOTAL', COUNT(i.id), COALESCE(SUM(i.quantity), 0),
+                       COALESCE(SUM(i.quantity * i.price), 0)
+                FROM items i
+                JOIN categories c ON c.id = i.category_id
+            )
+            ORDER BY grp, name
+        """, fetch=True) or []
         
         report = f"""
         📁 CATEGORY REPORT 📁
@@ -1182,47 +1489,39 @@ Authorized Personnel: C-LEVEL EXECUTIVES & OPERATIONS MANAGEMENT
         
         """
         
-        if categories:
-            report += "=" * 70 + "\n"
+        if len(rows) > 1:
+            *categories, totals = rows
+            separator = "=" * 70 + "\n"
+            report += separator
             report += f"{'Category':<20} {'Items':<10} {'Total Qty':<15} {'Total Value':<15}\n"
-            report += "=" * 70 + "\n"
-            
-            total_items = 0
-            total_quantity = 0
-            total_value = 0
-            
-            for category in categories:
-                name, item_count, quantity, value = category
-                item_count = item_count or 0
-                quantity = quantity or 0
-                value = value or 0
-                
-                report += f"{name:<20} {item_count:<10} {quantity:<15} ${value:<14.2f}\n"
-                
-                total_items += item_count
-                total_quantity += quantity
-                total_value += value
-            
-            report += "=" * 70 + "\n"
-            report += f"{'TOTAL':<20} {total_items:<10} {total_quantity:<15} ${total_value:<14.2f}\n"
+            report += separator
+            report += "".join(f"{name:<20} {item_count:<10} {quantity:<15} ${value:<14.2f}\n"
+                              for name, item_count, quantity, value in categories)
+            report += separator
+            report += f"{'TOTAL':<20} {totals['item_count']:<10} {totals['quantity']:<15} ${totals['value']:<14.2f}\n"
         else:
             report += "No categories found.\n"
         
         self.report_text.setPlainText(report)
     
+    def reload_all_data(self):
+        """Drop cached rows and reload everything from the database"""
+        self._categories_cache = None
+        self._category_name_map = None
+        self._all_items_cache = None
+        self.refresh_all_data()
+    
     def refresh_all_data(self):
         """Refresh all data in the application"""
         # Refresh dashboard
-        total_items = len(self.db_manager.execute_query("SELECT * FROM items", fetch=True) or [])
-        low_stock = len(self.db_manager.execute_query("SELECT * FROM items WHERE quantity = 0", fetch=True) or [])
+        self.load_dashboard_stats()
         
         # Refresh items tables
         self.load_all_items()
         self.load_low_stock_items()
         
         # Refresh categories
-        self.load_categories()
-        self.load_categories_table()
+        self._refresh_categories()
         
         # Refresh chart
         self.load_chart_data()
@@ -1230,132 +1529,162 @@ Authorized Personnel: C-LEVEL EXECUTIVES & OPERATIONS MANAGEMENT
         self.statusBar().showMessage("Data refreshed successfully")
     
     def export_to_excel(self):
-        """Export inventory data to Excel"""
+        """Export inventory data to Excel; the workbook is written on the thread pool"""
         try:
-            items = self.db_manager.execute_query("""
-                SELECT i.name, c.name, i.quantity, i.price, i.min_stock, i.supplier, i.barcode, i.date_added
+            df = self.db_manager.read_dataframe("""
+                SELECT i.name AS Name, i.category_id AS Category, i.quantity AS Quantity, i.price AS Price,
+                       i.min_stock AS "Min Stock", i.supplier AS Supplier, i.barcode AS Barcode,
+                       i.date_added AS "Date Added"
                 FROM items i
-                LEFT JOIN categories c ON i.category_id = c.id
                 ORDER BY i.name
-            """, fetch=True)
-            
-            if items:
-                df = pd.DataFrame(items, columns=[
-                    'Name', 'Category', 'Quantity', 'Price', 'Min Stock', 
-                    'Supplier', 'Barcode', 'Date Added'
-                ])
-                
-                filename = f"inventory_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
-                df.to_excel(filename, index=False)
-                QMessageBox.information(self, "Success", f"Data exported to {filename}")
-            else:
-                QMessageBox.warning(self, "Warning", "No data to export!")
+            """)
+            # Category ids are resolved from the cached name map rather than a join
+            df["Category"] = df["Category"].map(self.get_category_names())
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to export: {str(e)}")
+            return
+        
+        if df.empty:
+            QMessageBox.warning(self, "Warning", "No data to export!")
+            return
+        
+        filename = f"inventory_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
+        self.statusBar().showMessage(f"Exporting {filename}...")
+        self.run_in_background(self.on_export_finished, self.write_excel, df, filename,
+                               error_callback=self.on_export_failed)
+    
+    def write_excel(self, df, filename):
+        """Write the Excel export (runs on the thread pool, touches no widgets)"""
+        if EXCEL_ENGINE == "xlsxwriter":
+            # Constant-memory mode flushes each row to disk as it is written
+            with pd.ExcelWriter(filename, engine="xlsxwriter",
+                                engine_kwargs={"options": {"constant_memory": True}}) as writer:
+                df.to_excel(writer, index=False)
+        else:
+            df.to_excel(filename, index=False)
+        return f"Data exported to {filename}"
     
     def export_to_pdf(self):
         """Export inventory report to PDF with separate sections for available and out-of-stock items"""
-        try:
-            filename = f"inventory_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
-            doc = SimpleDocTemplate(filename, pagesize=letter)
-            
-            # Get all items
-            all_items = self.db_manager.execute_query("""
-                SELECT i.name, c.name, i.quantity, i.price, i.min_stock
-                FROM items i
-                LEFT JOIN categories c ON i.category_id = c.id
-                ORDER BY i.name
-            """, fetch=True)
-            
-            # Separate items by stock status
-            available_items = [item for item in all_items if item[2] > 0]
-            out_of_stock_items = [item for item in all_items if item[2] == 0]
-            
-            # Build PDF content
-            story = []
-            styles = getSampleStyleSheet()
-            
-            # Title
-            title = Paragraph("Complete Inventory Report", styles['Title'])
-            story.append(title)
+        filename = f"inventory_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
+        # Rows are read here on the GUI thread; the worker only gets plain data
+        # name, category, quantity, price, min_stock
+        all_items = [item[1:6] for item in self.get_all_items()]
+        self.statusBar().showMessage(f"Exporting {filename}...")
+        self.run_in_background(self.on_export_finished, self.build_pdf_report, filename, all_items,
+                               error_callback=self.on_export_failed)
+    
+    def build_pdf_report(self, filename, all_items):
+        """Build the PDF report (runs on the thread pool, touches no widgets)"""
+        doc = SimpleDocTemplate(filename, pagesize=letter)
+        
+        # Separate items by stock status in one pass; rows arrive in name order
+        available_items = []
+        out_of_stock_items = []
+        for item in all_items:
+            quantity = item[2]
+            if quantity == 0:
+                out_of_stock_items.append(item)
+            elif quantity is not None and quantity > 0:
+                available_items.append(item)
+        
+        # Build PDF content
+        story = []
+        styles = getSampleStyleSheet()
+        
+        # Title
+        title = Paragraph("Complete Inventory Report", styles['Title'])
+        story.append(title)
+        story.append(Spacer(1, 12))
+        
+        # Date and summary
+        date_p = Paragraph(f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", styles['Normal'])
+        story.append(date_p)
+        
+        summary = Paragraph(f"Total Items: {len(all_items)} | Available: {len(available_items)} | Out of Stock: {len(out_of_stock_items)}", styles['Normal'])
+        story.append(summary)
+        story.append(Spacer(1, 20))
+        
+        # Available Items Section
+        if available_items:
+            available_title = Paragraph("Available Items", styles['Heading2'])
+            story.append(available_title)
             story.append(Spacer(1, 12))
             
-            # Date and summary
-            date_p = Paragraph(f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", styles['Normal'])
-            story.append(date_p)
+            # Available items table
+            available_data = [['Name', 'Category', 'Quantity', 'Price', 'Min Stock']] + [
+                [item[0], item[1] or 'N/A', item[2], f"${item[3]:.2f}", item[4] or 0]
+                for item in available_items]
             
-            summary = Paragraph(f"Total Items: {len(all_items)} | Available: {len(available_items)} | Out of Stock: {len(out_of_stock_items)}", styles['Normal'])
-            story.append(summary)
+            # LongTable splits across pages and repeats the header row
+            available_table = LongTable(available_data, repeatRows=1)
+            available_table.setStyle(TableStyle([
+                ('BACKGROUND', (0, 0), (-1, 0), colors.green),
+                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+                ('FONTSIZE', (0, 0), (-1, 0), 12),
+                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+                ('BACKGROUND', (0, 1), (-1, -1), colors.lightgreen),
+                ('GRID', (0, 0), (-1, -1), 1, colors.black)
+            ]))
+            story.append(available_table)
             story.append(Spacer(1, 20))
+        
+        # Out of Stock Items Section
+        if out_of_stock_items:
+            # Critical alert
+            alert = Paragraph("⚠️ CRITICAL ALERT: Out of Stock Items", styles['Heading2'])
+            story.append(alert)
+            story.append(Spacer(1, 12))
             
-            # Available Items Section
-            if available_items:
-                available_title = Paragraph("Available Items", styles['Heading2'])
-                story.append(available_title)
-                story.append(Spacer(1, 12))
-                
-                # Available items table
-                available_data = [['Name', 'Category', 'Quantity', 'Price', 'Min Stock']]
-                for item in available_items:
-                    available_data.append([
-                        item[0], item[1] or 'N/A', str(item[2]), f"${item[3]:.2f}", str(item[4] or 0)
-                    ])
-                
-                available_table = Table(available_data)
-                available_table.setStyle(TableStyle([
-                    ('BACKGROUND', (0, 0), (-1, 0), colors.green),
-                    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                    ('FONTSIZE', (0, 0), (-1, 0), 12),
-                    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                    ('BACKGROUND', (0, 1), (-1, -1), colors.lightgreen),
-                    ('GRID', (0, 0), (-1, -1), 1, colors.black)
-                ]))
-                story.append(available_table)
-                story.append(Spacer(1, 20))
+            # Out of stock items table
+            out_of_stock_data = [['Name', 'Category', 'Quantity', 'Price', 'Min Stock']] + [
+                [item[0], item[1] or 'N/A', item[2], f"${item[3]:.2f}", item[4] or 0]
+                for item in out_of_stock_items]
             
-            # Out of Stock Items Section
-            if out_of_stock_items:
-                # Critical alert
-                alert = Paragraph("⚠️ CRITICAL ALERT: Out of Stock Items", styles['Heading2'])
-                story.append(alert)
-                story.append(Spacer(1, 12))
-                
-                # Out of stock items table
-                out_of_stock_data = [['Name', 'Category', 'Quantity', 'Price', 'Min Stock']]
-                for item in out_of_stock_items:
-                    out_of_stock_data.append([
-                        item[0], item[1] or 'N/A', str(item[2]), f"${item[3]:.2f}", str(item[4] or 0)
-                    ])
-                
-                out_of_stock_table = Table(out_of_stock_data)
-                out_of_stock_table.setStyle(TableStyle([
-                    ('BACKGROUND', (0, 0), (-1, 0), colors.red),
-                    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                    ('FONTSIZE', (0, 0), (-1, 0), 12),
-                    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                    ('BACKGROUND', (0, 1), (-1, -1), colors.mistyrose),
-                    ('GRID', (0, 0), (-1, -1), 1, colors.black)
-                ]))
-                story.append(out_of_stock_table)
-                story.append(Spacer(1, 12))
-                
-                # Action required note
-                action_note = Paragraph("Immediate Action Required: Contact suppliers for restocking these items.", styles['Normal'])
-                story.append(action_note)
-            else:
-                # Good news message
-                good_news = Paragraph("✅ Good News: All items are currently in stock!", styles['Heading3'])
-                story.append(good_news)
+            # LongTable splits across pages and repeats the header row
+            out_of_stock_table = LongTable(out_of_stock_data, repeatRows=1)
+            out_of_stock_table.setStyle(TableStyle([
+                ('BACKGROUND', (0, 0), (-1, 0), colors.red),
+                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+                ('FONTSIZE', (0, 0), (-1, 0), 12),
+                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+                ('BACKGROUND', (0, 1), (-1, -1), colors.mistyrose),
+                ('GRID', (0, 0), (-1, -1), 1, colors.black)
+            ]))
+            story.append(out_of_stock_table)
+            story.append(Spacer(1, 12))
             
-            doc.build(story)
-            QMessageBox.information(self, "Success", f"Report exported to {filename}")
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to export PDF: {str(e)}")
+            # Action required note
+            action_note = Paragraph("Immediate Action Required: Contact suppliers for restocking these items.", styles['Normal'])
+            story.append(action_note)
+        else:
+            # Good news message
+            good_news = Paragraph("✅ Good News: All items are currently in stock!", styles['Heading3'])
+            story.append(good_news)
+        
+        doc.build(story)
+        return f"Report exported to {filename}"
     
+    def on_export_finished(self, message):
+        """Report a completed export"""
+        self.statusBar().showMessage(message)
+        QMessageBox.information(self, "Success", message)
+    
+    def on_export_failed(self, error):
+        """Report a failed export"""
+        self.statusBar().showMessage("Export failed")
+        QMessageBox.critical(self, "Error", f"Failed to export: {error}")
+    
+    def closeEvent(self, event):
+        """Release the database connection when the window closes"""
+        QThreadPool.globalInstance().waitForDone()
+        self.db_manager.close()
+        super().closeEvent(event)
+
     def logout(self):
         """Logout and show login dialog"""
         reply = QMessageBox.question(self, "Logout", "Are you sure you want to logout?",
@@ -1369,6 +1698,7 @@ def main():
     
     # Set application style
     app.setStyle('Fusion')
+    app.setStyleSheet(APP_QSS)
     
     # Create and show main window
     window = InventoryApp()